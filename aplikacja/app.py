@@ -2,26 +2,41 @@ from __future__ import annotations
 import os
 import sys
 import csv
+import time
+import threading
 import traceback
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional
 
-# import modułów
-from vrptw.data import load_instance
-from vrptw.ga import run_ga
-from vrptw.split import split_routes
-
 # PySide6 - Interfejs
-from PySide6.QtCore import QThread, Signal, Slot
+# numpy, pandas, matplotlib i moduły vrptw są importowane leniwie (przy pierwszym użyciu
+# albo w tle po pokazaniu okna) - okno pojawia się bez czekania na ciężkie biblioteki
+from PySide6.QtCore import QSize, Qt, QThread, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QFormLayout, QLineEdit, QSpinBox, QDoubleSpinBox, QPushButton,
-    QFileDialog, QLabel, QProgressBar, QTextEdit, QMessageBox
+    QFileDialog, QLabel, QProgressBar, QTextEdit, QMessageBox,
+    QPlainTextEdit, QTableWidget, QTableWidgetItem, QAbstractItemView
 )
 
-# widżet matplotlib 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+# moduły ładowane w tle po pierwszym narysowaniu okna
+PRELOAD_MODULES = (
+    "numpy",
+    "pandas",
+    "matplotlib.figure",
+    "vrptw.data",
+    "vrptw.ga",
+    "vrptw.archive",
+)
+
+
+def _preload_modules():
+    import importlib
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # błąd wyjdzie przy właściwym użyciu modułu
 
 
 # kontener na przechowywanie argumentów z gui
@@ -36,20 +51,69 @@ class GAParams:
     alpha: float
     beta: float
     max_vehicles: int
+    road_edges: str = ""      # lista krawędzi sieci drogowej (opcjonalnie)
+    road_nodes: str = ""      # wierzchołki sieci z współrzędnymi (opcjonalnie)
+    seed: int = 0             # ziarno losowania (0 = losowe)
+    snapshot_every: int = 0   # co ile pokoleń zapisać populację w archiwum (0 = wcale)
 
 
-# klasa do tworzenia wykresu z matplotlib
-class MplCanvas(FigureCanvas):
+# klasa do tworzenia wykresu z matplotlib - figura tworzona dopiero przy pierwszym użyciu
+class MplCanvas(QWidget):
     def __init__(self, width: float = 5.0, height: float = 3.0, dpi: int = 100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        self.ax = self.fig.add_subplot(111)
-        super().__init__(self.fig)
+        super().__init__()
+        self._size = (width, height)
+        self._dpi = dpi
+        self._canvas = None
+        self.fig = None
+        self._ax = None
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    def sizeHint(self) -> QSize:
+        return QSize(int(self._size[0] * self._dpi), int(self._size[1] * self._dpi))
+
+    def _ensure(self):
+        if self._canvas is not None:
+            return
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        self.fig = Figure(figsize=self._size, dpi=self._dpi)
+        self._ax = self.fig.add_subplot(111)
+        self._canvas = FigureCanvas(self.fig)
+        self._layout.addWidget(self._canvas)
+
+    @property
+    def ax(self):
+        self._ensure()
+        return self._ax
+
+    def draw_idle(self):
+        if self._canvas is not None:
+            self._canvas.draw_idle()
 
     def clear(self):
-        self.ax.clear()
+        # pusty wykres nie wymaga tworzenia figury
+        if self._canvas is None:
+            return
+        self._ax.clear()
         self.draw_idle()
 
 
+# wczytanie instancji - euklidesowo albo po sieci drogowej (osobna macierz czasu T)
+def load_params_instance(params: GAParams):
+    if params.road_edges:
+        from vrptw.roads import load_road_instance
+        return load_road_instance(
+            params.instance_path,
+            params.road_edges,
+            nodes_path=params.road_nodes or None,
+        )
+    from vrptw.data import load_instance
+    df, D, Q = load_instance(params.instance_path)
+    return df, D, None, Q
+
+
 # główna funkcja obliczeń
 class GAWorker(QThread):
     finished = Signal(dict)  # wysyłanie obliczonego wyniku lub błędu
@@ -60,8 +124,17 @@ class GAWorker(QThread):
 
     def run(self):
         try:
-            # wczytanie instancji
-            df, D, Q = load_instance(self.params.instance_path)
+            import numpy as np
+            from vrptw.archive import RunRecorder, save_run
+            from vrptw.ga import run_ga
+            from vrptw.split import split_routes
+
+            df, D, T, Q = load_params_instance(self.params)
+
+            # ziarno zapisywane w archiwum - przebieg można powtórzyć
+            seed = self.params.seed or int(time.time_ns() % 2**31)
+            np.random.seed(seed)
+            recorder = RunRecorder(snapshot_every=self.params.snapshot_every)
 
             # uruchomienie GA
             best_perm, stats, history = run_ga(
@@ -74,7 +147,9 @@ class GAWorker(QThread):
                 beta=self.params.beta,
                 max_vehicles=self.params.max_vehicles,
                 time_limit_sec=60 * 60, #60 minut
-                gamma=1000.0
+                gamma=1000.0,
+                T=T,
+                on_generation=recorder
             )
 
             # uruchomienie splitu dla najlepszego osobnika
@@ -82,7 +157,8 @@ class GAWorker(QThread):
                 best_perm, df, D, Q,
                 self.params.alpha,
                 self.params.beta,
-                gamma=1000.0
+                gamma=1000.0,
+                T=T
             )
 
             # miękkie sprawdzenie limitu liczby pojazdów – tylko informacja
@@ -100,6 +176,19 @@ class GAWorker(QThread):
                 for i, val in enumerate(history, 1):
                     w.writerow([i, val])
 
+            # archiwum - każdy przebieg w osobnym wpisie (parametry, trasy, telemetria)
+            entry = save_run(
+                os.path.join(self.params.outdir, "runs"),
+                {**asdict(self.params), "gamma": 1000.0, "time_limit_sec": 60 * 60},
+                seed,
+                self.params.instance_path,
+                routes,
+                stats,
+                recorder,
+                road_edges=self.params.road_edges,
+                road_nodes=self.params.road_nodes,
+            )
+
             # rysowanie wyników w gui
             self.finished.emit({
                 "ok": True,
@@ -109,6 +198,8 @@ class GAWorker(QThread):
                 "stats": stats,
                 "history": history,
                 "vehicle_overflow": vehicle_overflow,
+                "seed": seed,
+                "archive": entry,
             })
 
         except Exception:
@@ -116,6 +207,96 @@ class GAWorker(QThread):
             self.finished.emit({"ok": False, "error": traceback.format_exc()})
 
 
+# wiele przebiegów naraz - pula procesów, instancja wczytana raz i współdzielona
+class MultiRunWorker(QThread):
+    progress = Signal(str, int, float)  # (run_id, pokolenie, najlepszy fitness)
+    run_finished = Signal(dict)         # wynik pojedynczego przebiegu lub błąd
+    all_finished = Signal(dict)         # koniec całej serii (ok / błąd wczytania)
+
+    def __init__(self, params: GAParams, configs: List[Dict[str, Any]], workers: int):
+        super().__init__()
+        self.params = params
+        self.configs = configs
+        self.workers = workers
+        self.df = None
+
+    def _drain(self, queue):
+        import queue as queue_mod
+        while True:
+            try:
+                run_id, gen, best = queue.get_nowait()
+            except queue_mod.Empty:
+                return
+            self.progress.emit(run_id, gen, best)
+
+    def run(self):
+        try:
+            import multiprocessing as mp
+            from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+            from vrptw.multirun import init_worker, run_config
+
+            # wspólne przetwarzanie wstępne: instancja i macierze liczone tylko raz
+            df, D, T, Q = load_params_instance(self.params)
+            self.df = df
+
+            ctx = mp.get_context()
+            queue = ctx.Queue()
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=ctx,
+                initializer=init_worker,
+                initargs=((df, D, T, Q), queue),
+            ) as ex:
+                # pełne parametry z formularza + nadpisania z linii - jak w pojedynczym przebiegu
+                pending = {
+                    ex.submit(
+                        run_config, f"R{i}", {**asdict(self.params), **cfg}, 1000.0, 60 * 60,
+                    ): f"R{i}"
+                    for i, cfg in enumerate(self.configs, 1)
+                }
+                while pending:
+                    done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    self._drain(queue)
+                    for fut in done:
+                        run_id = pending.pop(fut)
+                        try:
+                            self.run_finished.emit({"ok": True, **fut.result()})
+                        except Exception:
+                            self.run_finished.emit({
+                                "ok": False, "run_id": run_id, "error": traceback.format_exc()
+                            })
+            self._drain(queue)
+            self.all_finished.emit({"ok": True})
+
+        except Exception:
+            self.all_finished.emit({"ok": False, "error": traceback.format_exc()})
+
+
+# komórka tabeli sortowana po kluczu z Qt.UserRole
+# (np. numer przebiegu zamiast tekstu, inaczej "R10" < "R2")
+class SortItem(QTableWidgetItem):
+    def __lt__(self, other):
+        return self.data(Qt.UserRole) < other.data(Qt.UserRole)
+
+
+# kolumny tabeli wyników porównania
+RESULT_COLUMNS = (
+    ("Przebieg", "run_id"),
+    ("pop", "pop"),
+    ("gens", "gens"),
+    ("pc", "pc"),
+    ("pm", "pm"),
+    ("alpha", "alpha"),
+    ("beta", "beta"),
+    ("Ziarno", "seed"),
+    ("Fitness", "fitness"),
+    ("Dystans", "distance"),
+    ("Spóźnienia", "lateness"),
+    ("Pojazdy", "NV"),
+    ("Czas [s]", "wall_time"),
+)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -123,6 +304,9 @@ class MainWindow(QMainWindow):
         self.resize(1100, 760)
 
         self.worker: Optional[GAWorker] = None
+        self.multi_worker: Optional[MultiRunWorker] = None
+        self.multi_results: Dict[str, Dict[str, Any]] = {}
+        self.multi_curves: Dict[str, List[float]] = {}
         self.df = None
         self.routes: Optional[List[List[int]]] = None
         self.stats: Dict[str, Any] = {}
@@ -160,6 +344,29 @@ class MainWindow(QMainWindow):
         w_row2.setLayout(row2)
         form.addRow("Folder wyjściowy:", w_row2)
 
+        # sieć drogowa (opcjonalnie) - zamiast odległości euklidesowych
+        self.le_edges = QLineEdit()
+        self.le_edges.setPlaceholderText("brak - odległości euklidesowe")
+        btn_edges = QPushButton("Wybierz plik")
+        btn_edges.clicked.connect(self.on_browse_edges)
+        row3 = QHBoxLayout()
+        row3.addWidget(self.le_edges)
+        row3.addWidget(btn_edges)
+        w_row3 = QWidget()
+        w_row3.setLayout(row3)
+        form.addRow("Sieć drogowa:", w_row3)
+
+        self.le_nodes = QLineEdit()
+        self.le_nodes.setPlaceholderText("brak - kolumna 'node' w instancji")
+        btn_nodes = QPushButton("Wybierz plik")
+        btn_nodes.clicked.connect(self.on_browse_nodes)
+        row4 = QHBoxLayout()
+        row4.addWidget(self.le_nodes)
+        row4.addWidget(btn_nodes)
+        w_row4 = QWidget()
+        w_row4.setLayout(row4)
+        form.addRow("Wierzchołki sieci:", w_row4)
+
         # parametry GA
         self.sb_pop = QSpinBox()
         self.sb_pop.setRange(2, 100000)
@@ -193,6 +400,14 @@ class MainWindow(QMainWindow):
         self.sb_vehicles.setRange(1, 1000)
         self.sb_vehicles.setValue(10)
 
+        self.sb_seed = QSpinBox()
+        self.sb_seed.setRange(0, 2**31 - 1)
+        self.sb_seed.setSpecialValueText("losowe")
+
+        self.sb_snapshot = QSpinBox()
+        self.sb_snapshot.setRange(0, 100000)
+        self.sb_snapshot.setSpecialValueText("brak")
+
         form.addRow("Populacja:", self.sb_pop)
         form.addRow("Pokolenia:", self.sb_gens)
         form.addRow("Pc:", self.dsb_pc)
@@ -200,6 +415,8 @@ class MainWindow(QMainWindow):
         form.addRow("Alpha:", self.dsb_alpha)
         form.addRow("Beta:", self.dsb_beta)
         form.addRow("Liczba pojazdów:", self.sb_vehicles)
+        form.addRow("Ziarno:", self.sb_seed)
+        form.addRow("Snapshot populacji co:", self.sb_snapshot)
 
         left.addLayout(form)
 
@@ -209,10 +426,30 @@ class MainWindow(QMainWindow):
         self.btn_run.clicked.connect(self.on_run)
         self.btn_open_out = QPushButton("Otwórz folder wyników")
         self.btn_open_out.clicked.connect(self.on_open_outdir)
+        self.btn_preset = QPushButton("Wczytaj preset")
+        self.btn_preset.clicked.connect(self.on_load_preset)
         btns.addWidget(self.btn_run)
         btns.addWidget(self.btn_open_out)
+        btns.addWidget(self.btn_preset)
         left.addLayout(btns)
 
+        # porównanie wielu konfiguracji - jedna na linię, brakujące parametry z formularza
+        self.te_configs = QPlainTextEdit()
+        self.te_configs.setPlaceholderText("pop=20 pc=0.9 seed=1\npop=50 pm=0.1 seed=1")
+        self.te_configs.setMaximumHeight(90)
+        self.sb_workers = QSpinBox()
+        self.sb_workers.setRange(1, os.cpu_count() or 1)
+        self.sb_workers.setValue(min(4, os.cpu_count() or 1))
+        self.btn_multi = QPushButton("Start porównania")
+        self.btn_multi.clicked.connect(self.on_run_multi)
+        row_multi = QHBoxLayout()
+        row_multi.addWidget(QLabel("Równoległe przebiegi:"))
+        row_multi.addWidget(self.sb_workers)
+        row_multi.addWidget(self.btn_multi)
+        left.addWidget(QLabel("Porównanie konfiguracji:"))
+        left.addWidget(self.te_configs)
+        left.addLayout(row_multi)
+
         # status, progress, log
         self.progress = QProgressBar()
         self.progress.setRange(0, 0)
@@ -233,9 +470,34 @@ class MainWindow(QMainWindow):
         right.addWidget(QLabel("Trasy"))
         right.addWidget(self.canvas_routes)
 
+        # tabela wyników porównania - kliknięcie wiersza pokazuje trasy przebiegu
+        self.tbl_results = QTableWidget(0, len(RESULT_COLUMNS))
+        self.tbl_results.setHorizontalHeaderLabels([title for title, _ in RESULT_COLUMNS])
+        self.tbl_results.setSortingEnabled(True)
+        # domyślnie najlepsze przebiegi na górze
+        fitness_col = [key for _, key in RESULT_COLUMNS].index("fitness")
+        self.tbl_results.sortByColumn(fitness_col, Qt.AscendingOrder)
+        self.tbl_results.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tbl_results.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tbl_results.setMaximumHeight(180)
+        self.tbl_results.cellClicked.connect(self.on_result_clicked)
+        right.addWidget(QLabel("Wyniki porównania"))
+        right.addWidget(self.tbl_results)
+
+        # odświeżanie nałożonych krzywych zbieżności w trakcie porównania
+        self.curves_timer = QTimer(self)
+        self.curves_timer.setInterval(500)
+        self.curves_timer.timeout.connect(self._plot_curves)
+
         root.addLayout(left, 0)
         root.addLayout(right, 1)
 
+        # ciężkie moduły doładowywane w tle, gdy okno jest już widoczne
+        QTimer.singleShot(0, self._start_preload)
+
+    def _start_preload(self):
+        threading.Thread(target=_preload_modules, daemon=True).start()
+
     # handlery GUI
 
     @Slot()
@@ -252,6 +514,22 @@ class MainWindow(QMainWindow):
         if path:
             self.le_outdir.setText(path)
 
+    @Slot()
+    def on_browse_edges(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Wybierz listę krawędzi", "", "CSV (*.csv);;Wszystkie pliki (*.*)"
+        )
+        if path:
+            self.le_edges.setText(path)
+
+    @Slot()
+    def on_browse_nodes(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Wybierz wierzchołki sieci", "", "CSV (*.csv);;Wszystkie pliki (*.*)"
+        )
+        if path:
+            self.le_nodes.setText(path)
+
     @Slot()
     def on_open_outdir(self):
         outdir = self.le_outdir.text().strip() or os.getcwd()
@@ -265,11 +543,44 @@ class MainWindow(QMainWindow):
         except Exception:
             QMessageBox.warning(self, "Folder", f"Nie udało się otworzyć folderu: {outdir}")
 
+    @Slot()
+    def on_load_preset(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Wybierz preset", "", "JSON (*.json);;Wszystkie pliki (*.*)"
+        )
+        if not path:
+            return
+        try:
+            from vrptw.tuning import load_preset
+            params = load_preset(path)
+        except Exception:
+            QMessageBox.warning(self, "Preset", f"Nie udało się wczytać presetu: {path}")
+            return
+
+        # preset z tune.py - ustawiamy tylko parametry obecne w pliku
+        widgets = {
+            "pop": self.sb_pop,
+            "gens": self.sb_gens,
+            "pc": self.dsb_pc,
+            "pm": self.dsb_pm,
+            "alpha": self.dsb_alpha,
+            "beta": self.dsb_beta,
+            "max_vehicles": self.sb_vehicles,
+        }
+        for key, val in params.items():
+            if val is not None:
+                widgets[key].setValue(val)
+        self.log.append(f"Wczytano preset: {path}")
+
     def _collect(self) -> Optional[GAParams]:
         inst = self.le_instance.text().strip()
         if not inst or not os.path.exists(inst):
             QMessageBox.warning(self, "Instancja", "Wskaż istniejący plik CSV z instancją.")
             return None
+        edges = self.le_edges.text().strip()
+        if edges and not os.path.exists(edges):
+            QMessageBox.warning(self, "Sieć drogowa", "Wskaż istniejący plik CSV z krawędziami sieci.")
+            return None
         outdir = self.le_outdir.text().strip() or "out"
         return GAParams(
             instance_path=inst,
@@ -281,6 +592,10 @@ class MainWindow(QMainWindow):
             alpha=self.dsb_alpha.value(),
             beta=self.dsb_beta.value(),
             max_vehicles=self.sb_vehicles.value(),
+            road_edges=edges,
+            road_nodes=self.le_nodes.text().strip(),
+            seed=self.sb_seed.value(),
+            snapshot_every=self.sb_snapshot.value(),
         )
 
     @Slot()
@@ -289,6 +604,7 @@ class MainWindow(QMainWindow):
         if not p:
             return
         self.btn_run.setEnabled(False)
+        self.btn_multi.setEnabled(False)
         self.lbl_status.setText("Liczenie…")
         self.progress.setRange(0, 0)
         self.log.append("\n——— START ——–")
@@ -307,6 +623,7 @@ class MainWindow(QMainWindow):
     @Slot(dict)
     def on_finished(self, res: Dict[str, Any]):
         self.btn_run.setEnabled(True)
+        self.btn_multi.setEnabled(True)
         self.progress.setRange(0, 1)
         self.progress.setValue(1)
         if not res.get("ok"):
@@ -327,6 +644,7 @@ class MainWindow(QMainWindow):
 
         self.lbl_status.setText("Zakończono.")
         self.log.append("Zakończono.")
+        self.log.append(f"Ziarno: {res['seed']}\nArchiwum: {res['archive']}")
 
         st = self.stats
         self.log.append(
@@ -366,9 +684,157 @@ class MainWindow(QMainWindow):
         self._plot_routes()
         self._save_outputs()
 
+    @Slot()
+    def on_run_multi(self):
+        p = self._collect()
+        if not p:
+            return
+        from vrptw.multirun import parse_configs
+
+        defaults = {
+            "pop": p.pop, "gens": p.gens, "pc": p.pc, "pm": p.pm,
+            "alpha": p.alpha, "beta": p.beta, "max_vehicles": p.max_vehicles, "seed": p.seed,
+        }
+        try:
+            configs = parse_configs(self.te_configs.toPlainText(), defaults)
+        except ValueError as e:
+            QMessageBox.warning(self, "Porównanie", str(e))
+            return
+        if not configs:
+            QMessageBox.warning(self, "Porównanie", "Podaj co najmniej jedną konfigurację.")
+            return
+
+        self.btn_run.setEnabled(False)
+        self.btn_multi.setEnabled(False)
+        self.lbl_status.setText(f"Porównanie: 0/{len(configs)}")
+        self.progress.setRange(0, len(configs))
+        self.progress.setValue(0)
+        self.log.append("\n——— PORÓWNANIE ——–")
+        for i, cfg in enumerate(configs, 1):
+            self.log.append(f"R{i}: " + ", ".join(f"{k}={v}" for k, v in cfg.items()))
+
+        self.multi_results = {}
+        self.multi_curves = {}
+        self.tbl_results.setRowCount(0)
+        self.canvas_conv.clear()
+        self.canvas_routes.clear()
+
+        self.multi_worker = MultiRunWorker(p, configs, self.sb_workers.value())
+        self.multi_worker.progress.connect(self.on_multi_progress)
+        self.multi_worker.run_finished.connect(self.on_multi_run_finished)
+        self.multi_worker.all_finished.connect(self.on_multi_finished)
+        self.multi_worker.start()
+        self.curves_timer.start()
+
+    @Slot(str, int, float)
+    def on_multi_progress(self, run_id: str, gen: int, best: float):
+        # spóźnione komunikaty po zakończeniu przebiegu - krzywa jest już pełna
+        if run_id in self.multi_results:
+            return
+        self.multi_curves.setdefault(run_id, []).append(best)
+
+    @Slot(dict)
+    def on_multi_run_finished(self, res: Dict[str, Any]):
+        run_id = res["run_id"]
+        if not res.get("ok"):
+            self.log.append(f"\n!!! Błąd przebiegu {run_id} !!!\n" + res.get("error", ""))
+        else:
+            self.multi_results[run_id] = res
+            self.multi_curves[run_id] = list(res["history"])
+            self._add_result_row(res)
+            self.log.append(
+                f"{run_id}: fitness={res['stats']['fitness']:.2f}, "
+                f"pojazdy={res['NV']}, archiwum: {res['archive']}"
+            )
+        self.progress.setValue(self.progress.value() + 1)
+        self.lbl_status.setText(f"Porównanie: {self.progress.value()}/{self.progress.maximum()}")
+
+    @Slot(dict)
+    def on_multi_finished(self, res: Dict[str, Any]):
+        self.curves_timer.stop()
+        self._plot_curves()
+        self.btn_run.setEnabled(True)
+        self.btn_multi.setEnabled(True)
+        if not res.get("ok"):
+            self.lbl_status.setText("Błąd")
+            self.log.append("\n!!! Błąd wykonania !!!\n" + res.get("error", ""))
+            QMessageBox.critical(
+                self, "Błąd", "Wystąpił wyjątek podczas działania. Szczegóły w logu."
+            )
+            return
+        self.lbl_status.setText("Porównanie zakończone.")
+        self.log.append("Porównanie zakończone.")
+
+    def _add_result_row(self, res: Dict[str, Any]):
+        values = {
+            **res["config"],
+            **res["stats"],
+            "run_id": res["run_id"],
+            "seed": res["seed"],
+            "NV": res["NV"],
+            "wall_time": res["wall_time"],
+        }
+        # sortowanie wyłączone na czas wstawiania - inaczej wiersz "ucieka" w trakcie
+        self.tbl_results.setSortingEnabled(False)
+        row = self.tbl_results.rowCount()
+        self.tbl_results.insertRow(row)
+        for col, (_, key) in enumerate(RESULT_COLUMNS):
+            val = values[key]
+            item = SortItem()
+            # klucz sortowania liczbowy - przebieg po numerze, reszta po wartości
+            if key == "run_id":
+                item.setData(Qt.DisplayRole, val)
+                item.setData(Qt.UserRole, int(val[1:]))
+            elif isinstance(val, int):
+                item.setData(Qt.DisplayRole, int(val))
+                item.setData(Qt.UserRole, int(val))
+            else:
+                item.setData(Qt.DisplayRole, round(float(val), 2))
+                item.setData(Qt.UserRole, float(val))
+            self.tbl_results.setItem(row, col, item)
+        self.tbl_results.setSortingEnabled(True)
+
+    @Slot(int, int)
+    def on_result_clicked(self, row: int, col: int):
+        run_id = self.tbl_results.item(row, 0).text()
+        res = self.multi_results.get(run_id)
+        if res is None or self.multi_worker is None:
+            return
+        self.df = self.multi_worker.df
+        self.routes = res["routes"]
+        self.stats = res["stats"]
+        self.history = res["history"]
+        self._plot_routes()
+        self.log.append(f"\n=== TRASY {run_id} ===")
+        for idx, r in enumerate(self.routes, start=1):
+            self.log.append(f"Trasa {idx}: " + " -> ".join(str(nid) for nid in r))
+
+    def _plot_curves(self):
+        # nałożone krzywe zbieżności wszystkich przebiegów porównania
+        if not self.multi_curves:
+            return
+        ax = self.canvas_conv.ax
+        ax.clear()
+        for run_id, curve in self.multi_curves.items():
+            ax.plot(range(1, len(curve) + 1), curve, label=run_id)
+        ax.set_xlabel("Generacja")
+        ax.set_ylabel("Najlepszy fitness")
+        ax.set_title("Porównanie przebiegów")
+        ax.grid(True)
+        ax.legend(fontsize="small")
+        self.canvas_conv.draw_idle()
+
+    def _has_coords(self) -> bool:
+        # instancja z sieci drogowej może mieć tylko kolumnę 'node' - bez współrzędnych
+        return self.df is not None and {"x", "y"} <= set(self.df.columns)
+
     def _plot_routes(self):
         if self.df is None or not self.routes:
             return
+        if not self._has_coords():
+            self.canvas_routes.clear()
+            self.log.append("Instancja bez kolumn x/y - pominięto wykres tras.")
+            return
         xs = self.df["x"]
         ys = self.df["y"]
         ax = self.canvas_routes.ax
@@ -393,6 +859,8 @@ class MainWindow(QMainWindow):
         self.canvas_routes.draw_idle()
 
     def _save_outputs(self):
+        from matplotlib.figure import Figure
+
         outdir = self.le_outdir.text().strip() or "out"
         os.makedirs(outdir, exist_ok=True)
 
@@ -411,6 +879,8 @@ class MainWindow(QMainWindow):
             pass
 
         # routes.png
+        if not self._has_coords():
+            return
         try:
             fig_r = Figure(figsize=(6.4, 4.8), dpi=100)
             ax = fig_r.add_subplot(111)
@@ -0,0 +1,65 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# pomiar czasu startu GUI - import app.py w świeżym interpreterze
+# przykład:
+#   python benchmark.py --repeat 5 --max-ms 500
+
+# moduły, które nie mogą być ładowane przy imporcie app.py (ładowane leniwie)
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib", "vrptw.ga", "vrptw.data")
+
+_PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import app\n"
+    "dt = time.perf_counter() - t\n"
+    "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(dt, ','.join(heavy))\n"
+)
+
+
+def measure_import(repeat: int = 5):
+    # każdy pomiar w osobnym procesie - bez cache modułów z poprzedniego importu
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = _PROBE.format(heavy=HEAVY_MODULES)
+    times = []
+    heavy = set()
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=here,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(out[0]) * 1000)
+        if len(out) > 1:
+            heavy.update(out[1].split(","))
+    return times, sorted(heavy)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark czasu startu aplikacji")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--max-ms", type=float, default=None, help="próg mediany czasu importu [ms]")
+    args = ap.parse_args()
+
+    times, heavy = measure_import(args.repeat)
+    median = statistics.median(times)
+    print(f"Import app.py: mediana {median:.1f} ms (min {min(times):.1f}, max {max(times):.1f})")
+
+    failed = False
+    if heavy:
+        print(f"REGRESJA: przy starcie załadowano ciężkie moduły: {', '.join(heavy)}")
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"REGRESJA: mediana {median:.1f} ms > próg {args.max_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+
+from vrptw.tuning import config_grid, race, save_results
+
+
+# strojenie parametrów GA wyścigiem konfiguracji na zbiorze instancji i ziaren
+# przykład:
+#   python tune.py --instances data/data1.csv data/data2.csv --seeds 1 2 3 \
+#       --pop 20 50 --pc 0.8 0.9 --pm 0.1 0.2 --workers 4
+def main():
+    ap = argparse.ArgumentParser(description="Strojenie parametrów GA (racing)")
+    ap.add_argument("--instances", nargs="+", required=True, help="pliki CSV z instancjami")
+    ap.add_argument("--seeds", nargs="+", type=int, default=[1, 2, 3])
+    ap.add_argument("--pop", nargs="+", type=int, default=[20])
+    ap.add_argument("--gens", nargs="+", type=int, default=[40])
+    ap.add_argument("--pc", nargs="+", type=float, default=[0.9])
+    ap.add_argument("--pm", nargs="+", type=float, default=[0.2])
+    ap.add_argument("--alpha", nargs="+", type=float, default=[1000.0])
+    ap.add_argument("--beta", nargs="+", type=float, default=[100.0])
+    ap.add_argument("--max-vehicles", nargs="+", type=int, default=[10])
+    ap.add_argument("--workers", type=int, default=None, help="liczba procesów (domyślnie: liczba rdzeni)")
+    ap.add_argument("--min-blocks", type=int, default=3, help="bloki przed pierwszym odrzuceniem")
+    ap.add_argument(
+        "--t-crit", type=float, default=None,
+        help="próg statystyki t dla odrzucenia (domyślnie kwantyl 95%% dla n-1 stopni swobody)",
+    )
+    ap.add_argument("--time-limit", type=float, default=None, help="limit czasu jednego przebiegu [s]")
+    ap.add_argument("--outdir", default="out/tuning")
+    args = ap.parse_args()
+
+    configs = config_grid(
+        pop=args.pop,
+        gens=args.gens,
+        pc=args.pc,
+        pm=args.pm,
+        alpha=args.alpha,
+        beta=args.beta,
+        max_vehicles=args.max_vehicles,
+    )
+    print(f"Konfiguracje: {len(configs)}, instancje: {len(args.instances)}, ziarna: {len(args.seeds)}")
+
+    best, table = race(
+        configs,
+        args.instances,
+        args.seeds,
+        workers=args.workers,
+        min_blocks=args.min_blocks,
+        t_crit=args.t_crit,
+        time_limit_sec=args.time_limit,
+    )
+    table_csv, preset_json = save_results(args.outdir, best, table)
+
+    print("\n=== NAJLEPSZA KONFIGURACJA ===")
+    for k, v in best.items():
+        print(f"{k}: {v}")
+    print(f"\nTabela: {table_csv}\nPreset: {preset_json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+from vrptw.data import file_hash
+
+# wersja formatu wpisu archiwum - zwiększana przy niekompatybilnych zmianach
+ARCHIVE_VERSION = 1
+
+# kolumny telemetrii zapisywane dla każdego pokolenia
+TELEMETRY_COLUMNS = {
+    "generation": np.int32,
+    "best": np.float64,
+    "mean": np.float64,
+    "worst": np.float64,
+    "distance": np.float64,
+    "lateness": np.float64,
+    "vehicles": np.int16,
+    "wall_time": np.float32,
+}
+
+
+class RunRecorder:
+    # zbiera statystyki pokoleń z run_ga (przekazywany jako on_generation)
+    # i opcjonalnie co snapshot_every pokoleń kopię populacji
+
+    def __init__(self, snapshot_every: int = 0):
+        self.snapshot_every = snapshot_every
+        self.columns = {name: [] for name in TELEMETRY_COLUMNS}
+        self.snapshot_gens = []
+        self.snapshots = []
+
+    def __call__(self, record, pop):
+        for name in TELEMETRY_COLUMNS:
+            self.columns[name].append(record[name])
+        if self.snapshot_every and record["generation"] % self.snapshot_every == 0:
+            self.snapshot_gens.append(record["generation"])
+            self.snapshots.append(np.array(pop, dtype=np.int32))
+
+    def arrays(self):
+        return {
+            name: np.asarray(values, dtype=TELEMETRY_COLUMNS[name])
+            for name, values in self.columns.items()
+        }
+
+
+def _new_entry_dir(root, seed, instance_hash):
+    # osobny katalog dla każdego przebiegu - nic nie jest nadpisywane
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    base = f"{stamp}_{instance_hash[:8]}_s{seed}"
+    for k in range(1000):
+        path = os.path.join(root, base if k == 0 else f"{base}_{k}")
+        try:
+            os.makedirs(path)
+            return path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"Nie udało się utworzyć wpisu archiwum w {root}")
+
+
+def network_hash(road_edges=None, road_nodes=None):
+    # skrót sieci drogowej (krawędzie + opcjonalnie wierzchołki); None = odległości euklidesowe
+    if not road_edges:
+        return None
+    h = hashlib.sha256(file_hash(road_edges).encode())
+    if road_nodes:
+        h.update(file_hash(road_nodes).encode())
+    return h.hexdigest()
+
+
+def save_run(
+    root,
+    params,
+    seed,
+    instance_path,
+    routes,
+    stats,
+    recorder: RunRecorder,
+    road_edges=None,
+    road_nodes=None,
+):
+    # zapis jednego przebiegu: meta.json (parametry, wynik, trasy)
+    # + telemetry.npz (kolumny statystyk) + opcjonalnie snapshots.npz
+    instance_hash = file_hash(instance_path)
+    path = _new_entry_dir(root, seed, instance_hash)
+
+    meta = {
+        "version": ARCHIVE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": params,
+        "seed": seed,
+        "instance": os.path.abspath(instance_path),
+        "instance_hash": instance_hash,
+        "network_hash": network_hash(road_edges, road_nodes),
+        "stats": {k: float(v) for k, v in stats.items()},
+        "routes": [[int(nid) for nid in r] for r in routes],
+    }
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
+
+    np.savez_compressed(os.path.join(path, "telemetry.npz"), **recorder.arrays())
+
+    if recorder.snapshots:
+        np.savez_compressed(
+            os.path.join(path, "snapshots.npz"),
+            generation=np.asarray(recorder.snapshot_gens, dtype=np.int32),
+            population=np.stack(recorder.snapshots),
+        )
+    return path
+
+
+def list_runs(root, instance_hash: str | None = None, network_hash: str | None = None):
+    # wpisy archiwum (meta.json) posortowane chronologicznie; filtry:
+    #   network_hash - przebiegi na danej sieci drogowej (dowolna instancja)
+    #   instance_hash - przebiegi na danej instancji i sieci network_hash (None = euklidesowo)
+    # bez filtrów - wszystkie wpisy
+    if not os.path.isdir(root):
+        return []
+    runs = []
+    for name in sorted(os.listdir(root)):
+        meta_json = os.path.join(root, name, "meta.json")
+        if not os.path.exists(meta_json):
+            continue
+        with open(meta_json, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version", 0) > ARCHIVE_VERSION:
+            continue  # wpis z nowszej wersji aplikacji
+        if instance_hash is not None and meta["instance_hash"] != instance_hash:
+            continue
+        if (instance_hash is not None or network_hash is not None) and (
+            meta.get("network_hash") != network_hash
+        ):
+            continue
+        meta["path"] = os.path.join(root, name)
+        runs.append(meta)
+    return runs
+
+
+def load_telemetry(entry_path, columns=None):
+    with np.load(os.path.join(entry_path, "telemetry.npz")) as z:
+        return {name: z[name] for name in (columns or z.files)}
+
+
+def load_snapshots(entry_path):
+    snap_npz = os.path.join(entry_path, "snapshots.npz")
+    if not os.path.exists(snap_npz):
+        return None, None
+    with np.load(snap_npz) as z:
+        return z["generation"], z["population"]
+
+
+def load_curves(
+    root,
+    column: str = "best",
+    instance_hash: str | None = None,
+    network_hash: str | None = None,
+):
+    # krzywe zbieżności wielu przebiegów jako jedna macierz (przebieg x pokolenie),
+    # krótsze przebiegi dopełnione NaN - gotowe do nałożenia na wykres
+    runs = list_runs(root, instance_hash=instance_hash, network_hash=network_hash)
+    curves = [load_telemetry(r["path"], [column])[column] for r in runs]
+    length = max((len(c) for c in curves), default=0)
+    out = np.full((len(curves), length), np.nan)
+    for i, c in enumerate(curves):
+        out[i, :len(c)] = c
+    return runs, out
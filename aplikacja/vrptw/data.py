@@ -1,13 +1,27 @@
+import hashlib
 import pandas as pd
 import numpy as np
 
-def load_instance(filename, Q=None):
+def file_hash(filename):
+    # skrót sha256 zawartości pliku - identyfikuje instancję / sieć drogową
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def read_instance(filename, Q=None):
     df = pd.read_csv(filename, sep=';')
     df = df.sort_values('id').reset_index(drop=True) 
 
     if Q is None:
         Q = df[df['id'] == 0]['vehicle_capacity'].values[0] 
 
+    return df, Q
+
+def load_instance(filename, Q=None):
+    df, Q = read_instance(filename, Q)
+
     # macierz euklidesowa | macierz odległosci
     coords = df[['x', 'y']].values
     D = np.linalg.norm(coords[:, None, :] - coords[None, :, :], axis=2)
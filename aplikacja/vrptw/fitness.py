@@ -9,8 +9,12 @@ def fitness_penalty_from_routes(
     beta: float = 100.0,
     max_vehicles: int | None = None,
     gamma: float = 0.0,
+    T=None,
 ):
     
+    if T is None:                 # brak osobnej macierzy czasu - czas przejazdu = dystans
+        T = D
+
     total_distance = 0.0          # całkowity dystans
     cap_violation = 0.0           # suma przekroczeń ładunku
     time_violation = 0.0          # suma spóźnień
@@ -27,7 +31,7 @@ def fitness_penalty_from_routes(
             service = df.loc[nid, "service"]
 
             # przejazd do klienta
-            t += D[last, nid]
+            t += T[last, nid]
             total_distance += D[last, nid]
 
             # okno czasowe: oczekiwanie / spóźnienie
@@ -16,10 +16,26 @@ def run_ga(
     beta: float,
     max_vehicles: int | None = None,
     time_limit_sec: float | None = None,
-    gamma: float = 0.0
+    gamma: float = 0.0,
+    T=None,
+    on_generation=None
 ):
     
     n = len(df) - 1  # pomijamy depot (id=0)
+    t0 = time.time()  # czas ścienny do telemetrii (łącznie z oceną populacji startowej)
+
+    # statystyki pokolenia przekazywane do on_generation(record, pop)
+    def generation_record(gen: int) -> dict:
+        return {
+            "generation": gen,
+            "best": best_fit,
+            "mean": float(fits.mean()),
+            "worst": float(fits.max()),
+            "distance": float(best_stats[0]),
+            "lateness": float(best_stats[2]),
+            "vehicles": best_stats[3],
+            "wall_time": time.time() - t0,
+        }
 
     #inicjalizacja populacji
 
@@ -65,11 +81,11 @@ def run_ga(
 
     pop = init_population(pop_size, n)
     fits = np.empty(pop_size)
-    extra = [None] * pop_size  # (distance, overload, lateness)
+    extra = [None] * pop_size  # (distance, overload, lateness, vehicles)
 
     # ocena początkowej populacji
     for i in range(pop_size):
-        routes, _, _ = split_routes(pop[i], df, D, Q, alpha=alpha, beta=beta,gamma=gamma)
+        routes, _, _ = split_routes(pop[i], df, D, Q, alpha=alpha, beta=beta,gamma=gamma, T=T)
         f, d, q, t = fitness_penalty_from_routes(
             routes,
             df,
@@ -78,21 +94,24 @@ def run_ga(
             alpha=alpha,
             beta=beta,
             max_vehicles=max_vehicles,
-            gamma=gamma
+            gamma=gamma,
+            T=T
         )
         fits[i] = f
-        extra[i] = (d, q, t)
+        extra[i] = (d, q, t, len(routes))
 
     best_idx = int(np.argmin(fits))
     best = pop[best_idx].copy()
     best_stats = extra[best_idx]
     best_fit = float(fits[best_idx])
     history = [best_fit]
+    if on_generation is not None:
+        on_generation(generation_record(0), pop)
 
     # główna pętla GA
     start_time = time.time()
 
-    for _ in range(gens):
+    for gen in range(1, gens + 1):
         # limit czasu - przerywamy jeśli przekroczony
         if time_limit_sec is not None and (time.time() - start_time) >= time_limit_sec:
             break
@@ -119,7 +138,7 @@ def run_ga(
 
         # ocena nowej populacji
         for i in range(pop_size):
-            routes, _, _ = split_routes(pop[i], df, D, Q, alpha=alpha, beta=beta,gamma=gamma)
+            routes, _, _ = split_routes(pop[i], df, D, Q, alpha=alpha, beta=beta,gamma=gamma, T=T)
             f, d, q, t = fitness_penalty_from_routes(
                 routes,
                 df,
@@ -128,10 +147,11 @@ def run_ga(
                 alpha=alpha,
                 beta=beta,
                 max_vehicles=max_vehicles,
-                gamma=gamma
+                gamma=gamma,
+                T=T
             )
             fits[i] = f
-            extra[i] = (d, q, t)
+            extra[i] = (d, q, t, len(routes))
 
         best_idx = int(np.argmin(fits))
         if fits[best_idx] < best_fit:
@@ -140,11 +160,14 @@ def run_ga(
             best_stats = extra[best_idx]
 
         history.append(best_fit)
+        if on_generation is not None:
+            on_generation(generation_record(gen), pop)
 
     stats = {
         "fitness": best_fit,
         "distance": best_stats[0],
         "overload": best_stats[1],
         "lateness": best_stats[2],
+        "vehicles": best_stats[3],
     }
     return best, stats, history
@@ -0,0 +1,109 @@
+import os
+
+import numpy as np
+from vrptw.archive import RunRecorder, save_run
+from vrptw.ga import run_ga
+from vrptw.split import split_routes
+
+# klucze, które można podać w linii konfiguracji (reszta z formularza GUI)
+CONFIG_KEYS = {
+    "pop": int,
+    "gens": int,
+    "pc": float,
+    "pm": float,
+    "alpha": float,
+    "beta": float,
+    "max_vehicles": int,
+    "seed": int,
+}
+
+# dane współdzielone w procesie roboczym - ustawiane raz przez initializer puli
+_shared = None
+_progress = None
+
+
+def parse_configs(text, defaults):
+    # jedna konfiguracja na linię, np. "pop=50 pc=0.8 seed=3"; brakujące klucze z defaults
+    configs = []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        cfg = dict(defaults)
+        for token in line.replace(",", " ").split():
+            key, sep, val = token.partition("=")
+            if not sep or key not in CONFIG_KEYS:
+                raise ValueError(f"Linia {lineno}: nieznany parametr '{token}'")
+            cfg[key] = CONFIG_KEYS[key](val)
+        configs.append(cfg)
+    return configs
+
+
+def init_worker(shared, progress):
+    # instancja (df, D, T, Q) przekazywana raz na proces, tylko do odczytu
+    global _shared, _progress
+    _shared = shared
+    _progress = progress
+
+
+def run_config(
+    run_id,
+    config,
+    gamma: float = 1000.0,
+    time_limit_sec: float | None = None,
+):
+    # jeden przebieg GA w procesie roboczym; postęp (run_id, pokolenie, best) trafia do kolejki
+    # config - pełne parametry GUI (jak GAParams) z nadpisaniami z linii porównania
+    df, D, T, Q = _shared
+    seed = config.get("seed") or int.from_bytes(os.urandom(4), "little") >> 1
+    np.random.seed(seed)
+    recorder = RunRecorder(snapshot_every=config.get("snapshot_every", 0))
+
+    def on_generation(record, pop):
+        recorder(record, pop)
+        if _progress is not None:
+            _progress.put((run_id, record["generation"], record["best"]))
+
+    best_perm, stats, history = run_ga(
+        df, D, Q,
+        pop_size=config["pop"],
+        gens=config["gens"],
+        pc=config["pc"],
+        pm=config["pm"],
+        alpha=config["alpha"],
+        beta=config["beta"],
+        max_vehicles=config["max_vehicles"],
+        time_limit_sec=time_limit_sec,
+        gamma=gamma,
+        T=T,
+        on_generation=on_generation
+    )
+    routes, NV, _ = split_routes(
+        best_perm, df, D, Q,
+        config["alpha"],
+        config["beta"],
+        gamma=gamma,
+        T=T
+    )
+    entry = save_run(
+        os.path.join(config["outdir"], "runs"),
+        {**config, "gamma": gamma, "time_limit_sec": time_limit_sec},
+        seed,
+        config["instance_path"],
+        routes,
+        stats,
+        recorder,
+        road_edges=config.get("road_edges"),
+        road_nodes=config.get("road_nodes"),
+    )
+    return {
+        "run_id": run_id,
+        "config": config,
+        "seed": seed,
+        "stats": stats,
+        "routes": routes,
+        "NV": NV,
+        "history": history,
+        "wall_time": float(recorder.columns["wall_time"][-1]),
+        "archive": entry,
+    }
@@ -0,0 +1,152 @@
+import hashlib
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from vrptw.data import file_hash, read_instance
+
+# sieć drogowa w danym procesie roboczym: wierzchołek -> [(sąsiad, długość, czas)]
+_graph = {}
+
+
+def read_road_network(edges_path, directed=False):
+    # lista krawędzi: u;v;length[;time] - bez kolumny time czas = długość
+    edges = pd.read_csv(edges_path, sep=';')
+    if 'time' not in edges.columns:
+        edges['time'] = edges['length']
+
+    adj = {}
+    for u, v, length, t in edges[['u', 'v', 'length', 'time']].itertuples(index=False):
+        u, v = int(u), int(v)
+        adj.setdefault(u, []).append((v, float(length), float(t)))
+        if not directed:
+            adj.setdefault(v, []).append((u, float(length), float(t)))
+    return adj
+
+
+def snap_to_nodes(df, nodes_path):
+    # przypisanie klientów do najbliższych wierzchołków sieci (po współrzędnych x, y)
+    nodes = pd.read_csv(nodes_path, sep=';')
+    node_xy = nodes[['x', 'y']].values
+    cust_xy = df[['x', 'y']].values
+    d2 = ((cust_xy[:, None, :] - node_xy[None, :, :]) ** 2).sum(axis=2)
+    return nodes['id'].values[d2.argmin(axis=1)]
+
+
+def _init_worker(adj):
+    global _graph
+    _graph = adj
+
+
+def _dijkstra(src, targets, primary):
+    # jedna ścieżka na parę: minimalizujemy wagę główną (primary: 1 - długość, 2 - czas),
+    # druga wielkość liczona wzdłuż tej samej ścieżki (remis rozstrzyga druga waga);
+    # kończymy po osiągnięciu wszystkich celów
+    secondary = 3 - primary
+    best = {src: (0.0, 0.0)}
+    left = set(targets)
+    heap = [(0.0, 0.0, src)]
+    done = set()
+    while heap and left:
+        d, d2, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        left.discard(u)
+        for edge in _graph.get(u, ()):
+            v = edge[0]
+            cand = (d + edge[primary], d2 + edge[secondary])
+            if cand < best.get(v, (float('inf'), float('inf'))):
+                best[v] = cand
+                heapq.heappush(heap, (cand[0], cand[1], v))
+
+    # (długość, czas) do każdego celu
+    inf = (float('inf'), float('inf'))
+    out = [inf if t in left else best[t] for t in targets]
+    if primary == 2:
+        out = [(length, t) for t, length in out]
+    return out
+
+
+def _rows_from(sources, targets, primary):
+    # wiersze macierzy D i T dla części źródeł - wywoływane w procesie roboczym
+    rows = []
+    for s in sources:
+        pairs = _dijkstra(s, targets, primary)
+        rows.append(([p[0] for p in pairs], [p[1] for p in pairs]))
+    return rows
+
+
+def road_matrices(adj, node_ids, workers=None, by: str = 'time'):
+    # macierze odległości i czasu przejazdu między klientami - źródła dzielone między procesy;
+    # D i T opisują tę samą ścieżkę: najszybszą (by='time') albo najkrótszą (by='length')
+    primary = {'length': 1, 'time': 2}[by]
+    node_ids = [int(n) for n in node_ids]
+    workers = workers or os.cpu_count() or 1
+    chunks = [node_ids[i::workers] for i in range(workers)]
+
+    D = np.empty((len(node_ids), len(node_ids)))
+    T = np.empty_like(D)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(adj,)) as ex:
+        for k, rows in enumerate(ex.map(_rows_from, chunks, [node_ids] * workers, [primary] * workers)):
+            for r, (d_row, t_row) in enumerate(rows):
+                D[k + r * workers] = d_row
+                T[k + r * workers] = t_row
+    return D, T
+
+
+def load_road_instance(
+    filename,
+    edges_path,
+    nodes_path=None,
+    Q=None,
+    directed: bool = False,
+    cache_dir: str | None = None,
+    workers: int | None = None,
+    by: str = 'time',
+):
+    # instancja z macierzami D (odległość) i T (czas) liczonymi po sieci drogowej;
+    # klienci wskazani kolumną 'node' albo przyciągnięci do sieci po współrzędnych
+    df, Q = read_instance(filename, Q)
+    if 'node' in df.columns and nodes_path:
+        # dwa sposoby przypisania naraz - nie zgadujemy, który był zamierzony
+        raise ValueError(
+            "Instancja ma kolumnę 'node' i wskazano plik z wierzchołkami sieci - "
+            "usuń kolumnę 'node' albo nie podawaj pliku z wierzchołkami."
+        )
+    if 'node' in df.columns:
+        node_ids = df['node'].values
+    elif nodes_path is not None:
+        node_ids = snap_to_nodes(df, nodes_path)
+    else:
+        raise ValueError("Instancja nie ma kolumny 'node' - wskaż plik z wierzchołkami sieci.")
+
+    # klucz cache: zawartość sieci + kolejność wierzchołków klientów
+    key = hashlib.sha256()
+    key.update(file_hash(edges_path).encode())
+    key.update(np.asarray(node_ids, dtype=np.int64).tobytes())
+    key.update(b'directed' if directed else b'undirected')
+    key.update(by.encode())
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(edges_path)), '.road_cache')
+    cache_file = os.path.join(cache_dir, key.hexdigest()[:32] + '.npz')
+
+    if os.path.exists(cache_file):
+        with np.load(cache_file) as z:
+            D, T = z['D'].astype(float), z['T'].astype(float)
+    else:
+        adj = read_road_network(edges_path, directed=directed)
+        D, T = road_matrices(adj, node_ids, workers=workers, by=by)
+        if not np.isfinite(D).all():
+            raise ValueError("Część klientów jest nieosiągalna w sieci drogowej.")
+        # float32 + kompresja - cache zajmuje ułamek pełnej macierzy;
+        # zwracamy te same zaokrąglone wartości co przy odczycie z cache (powtarzalne wyniki)
+        D, T = D.astype(np.float32), T.astype(np.float32)
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez_compressed(cache_file, D=D, T=T)
+        D, T = D.astype(float), T.astype(float)
+
+    return df, D, T, Q
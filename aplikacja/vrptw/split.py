@@ -1,7 +1,9 @@
 import numpy as np
 
-def split_routes(pi, df, D, Q, alpha=1000.0, beta=100.0, gamma=0.0):
+def split_routes(pi, df, D, Q, alpha=1000.0, beta=100.0, gamma=0.0, T=None):
  
+    if T is None:              # brak osobnej macierzy czasu - czas przejazdu = dystans
+        T = D
     n = len(pi)                #liczba klientów w permutacji
     INF = float('inf')
 
@@ -34,7 +36,7 @@ def split_routes(pi, df, D, Q, alpha=1000.0, beta=100.0, gamma=0.0):
                 return INF
 
             cost += D[last, nid]    # aktualizacja kosztu
-            t += D[last, nid]       # aktualizacja czasu o przyjazd
+            t += T[last, nid]       # aktualizacja czasu o przyjazd
 
             # przyjazd za wczesnie - nie karze tutaj
             if t < ready:
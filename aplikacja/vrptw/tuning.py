@@ -0,0 +1,207 @@
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from vrptw.data import load_instance
+from vrptw.ga import run_ga
+
+# parametry GA, które można stroić (nazwy jak w GUI)
+PARAM_KEYS = ("pop", "gens", "pc", "pm", "alpha", "beta", "max_vehicles")
+
+# instancje wczytane w danym procesie roboczym (każdy proces ma własną kopię)
+_instances = {}
+
+
+def _get_instance(path):
+    if path not in _instances:
+        _instances[path] = load_instance(path)
+    return _instances[path]
+
+
+def config_grid(**values):
+    # iloczyn kartezjański list wartości -> lista konfiguracji (słowników)
+    keys = [k for k in PARAM_KEYS if k in values]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(values[k] for k in keys))]
+
+
+def evaluate_config(path, config, seed, gamma=1000.0, time_limit_sec=None):
+    # jeden przebieg GA dla pary (instancja, ziarno) - wywoływane w procesie roboczym
+    df, D, Q = _get_instance(path)
+    np.random.seed(seed)
+    _, stats, _ = run_ga(
+        df, D, Q,
+        pop_size=int(config["pop"]),
+        gens=int(config["gens"]),
+        pc=float(config["pc"]),
+        pm=float(config["pm"]),
+        alpha=float(config["alpha"]),
+        beta=float(config["beta"]),
+        max_vehicles=config.get("max_vehicles"),
+        time_limit_sec=time_limit_sec,
+        gamma=gamma
+    )
+    return stats["fitness"]
+
+
+# jednostronne wartości krytyczne t-Studenta dla poziomu 95% (liczba stopni swobody -> t);
+# dla stopni swobody spoza tabeli bierzemy najbliższą mniejszą pozycję (ostrożniej)
+T_CRIT_95 = {
+    1: 6.314, 2: 2.920, 3: 2.353, 4: 2.132, 5: 2.015, 6: 1.943, 7: 1.895, 8: 1.860,
+    9: 1.833, 10: 1.812, 11: 1.796, 12: 1.782, 13: 1.771, 14: 1.761, 15: 1.753,
+    16: 1.746, 17: 1.740, 18: 1.734, 19: 1.729, 20: 1.725, 21: 1.721, 22: 1.717,
+    23: 1.714, 24: 1.711, 25: 1.708, 26: 1.706, 27: 1.703, 28: 1.701, 29: 1.699,
+    30: 1.697, 40: 1.684, 60: 1.671, 120: 1.658,
+}
+
+
+def t_critical(dof: int) -> float:
+    return T_CRIT_95[max(k for k in T_CRIT_95 if k <= max(dof, 1))]
+
+
+def _rankdata(values):
+    # rangi od 1; remisy dostają średnią rangę (jak w teście Friedmana)
+    order = values.argsort(kind="stable")
+    sorted_vals = values[order]
+    ranks = np.empty(len(values))
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and sorted_vals[j + 1] == sorted_vals[i]:
+            j += 1
+        ranks[order[i:j + 1]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def _block_ranks(results, alive):
+    # rangi konfiguracji w każdym bloku (instancja, ziarno) - niezależne od skali fitnessu
+    sub = results[alive]
+    return np.column_stack([_rankdata(sub[:, b]) for b in range(sub.shape[1])])
+
+
+def _eliminate(results, alive, t_crit=None):
+    # test sparowany różnic rang względem najlepszej konfiguracji;
+    # odrzucamy te, które są istotnie gorsze (t > t_crit, domyślnie kwantyl 95% dla n-1 st. swobody)
+    ranks = _block_ranks(results, alive)
+    mean_ranks = ranks.mean(axis=1)
+    best = int(np.argmin(mean_ranks))
+    n = ranks.shape[1]
+    if t_crit is None:
+        t_crit = t_critical(n - 1)
+
+    keep = []
+    for k, c in enumerate(alive):
+        if k == best:
+            keep.append(c)
+            continue
+        diff = ranks[k] - ranks[best]
+        mean = diff.mean()
+        std = diff.std(ddof=1)
+        if std == 0:
+            dominated = mean > 0
+        else:
+            dominated = mean / (std / np.sqrt(n)) > t_crit
+        if not dominated:
+            keep.append(c)
+    return keep
+
+
+def race(
+    configs,
+    instances,
+    seeds,
+    workers: int | None = None,
+    min_blocks: int = 3,
+    t_crit: float | None = None,
+    gamma: float = 1000.0,
+    time_limit_sec: float | None = None,
+    log=print,
+):
+    # wyścig konfiguracji (F-race): kolejne bloki (instancja, ziarno) liczone równolegle,
+    # po każdej partii odrzucane są konfiguracje statystycznie zdominowane
+    blocks = [(inst, seed) for seed in seeds for inst in instances]
+    workers = workers or os.cpu_count() or 1
+
+    results = np.full((len(configs), len(blocks)), np.nan)
+    alive = list(range(len(configs)))
+    eliminated_at = {}
+    done = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        while done < len(blocks):
+            # tyle bloków naraz, aby zająć wszystkie procesy
+            step = max(1, -(-workers // len(alive)))
+            batch = range(done, min(done + step, len(blocks)))
+
+            futures = {}
+            for b in batch:
+                inst, seed = blocks[b]
+                for c in alive:
+                    fut = ex.submit(evaluate_config, inst, configs[c], seed, gamma, time_limit_sec)
+                    futures[fut] = (c, b)
+            for fut, (c, b) in futures.items():
+                results[c, b] = fut.result()
+
+            done = batch.stop
+            log(f"Bloki {done}/{len(blocks)}, aktywne konfiguracje: {len(alive)}")
+
+            if done >= min_blocks and len(alive) > 1:
+                keep = _eliminate(results[:, :done], alive, t_crit)
+                for c in alive:
+                    if c not in keep:
+                        eliminated_at[c] = done
+                        log(f"Odrzucono konfigurację {configs[c]} po {done} blokach")
+                alive = keep
+
+    # tabela wyników - rangi ocalałych liczone na wszystkich blokach,
+    # odrzuconych na blokach, które zdążyły przejść
+    survivor_ranks = dict(zip(alive, _block_ranks(results, alive).mean(axis=1)))
+    table = []
+    for c, cfg in enumerate(configs):
+        evaluated = eliminated_at.get(c, len(blocks))
+        table.append({
+            **cfg,
+            "mean_rank": float(survivor_ranks[c]) if c in alive else None,
+            "mean_fitness": float(np.mean(results[c, :evaluated])),
+            "blocks": evaluated,
+            "status": "aktywna" if c in alive else f"odrzucona po {evaluated}",
+        })
+
+    # najpierw ocalałe wg średniej rangi, potem odrzucone - im później, tym wyżej
+    # (odrzucona w ostatniej partii też ma blocks == len(blocks), więc decyduje status)
+    def sort_key(r):
+        if r["mean_rank"] is not None:
+            return (0, r["mean_rank"], 0.0)
+        return (1, -r["blocks"], r["mean_fitness"])
+
+    table.sort(key=sort_key)
+    best = {k: table[0][k] for k in PARAM_KEYS if k in table[0]}
+    return best, table
+
+
+def save_results(outdir, best, table):
+    # tabela wyników (csv) + preset do wczytania w GUI (json)
+    os.makedirs(outdir, exist_ok=True)
+
+    table_csv = os.path.join(outdir, "tuning.csv")
+    with open(table_csv, "w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(table[0].keys()))
+        w.writeheader()
+        w.writerows(table)
+
+    preset_json = os.path.join(outdir, "preset.json")
+    with open(preset_json, "w", encoding="utf-8") as f:
+        json.dump({"params": best, "table": table}, f, indent=2, ensure_ascii=False)
+
+    return table_csv, preset_json
+
+
+def load_preset(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    # akceptujemy zarówno pełny plik z tuningu, jak i sam słownik parametrów
+    params = data.get("params", data)
+    return {k: params[k] for k in PARAM_KEYS if k in params}